@@ -0,0 +1,126 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled versions of Parser.escape_illegal_characters and Parser.ensure_ending_brackets.
+The extension is optional: parser.py falls back to the pure-Python methods when it is not built,
+so both implementations must keep producing identical output.
+"""
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cpython.unicode cimport PyUnicode_FromKindAndData, PyUnicode_4BYTE_KIND, Py_UNICODE_ISSPACE
+
+
+cdef inline bint _is_string_end(str s, Py_ssize_t j, Py_ssize_t n):
+    # Mirrors the look-ahead in escape_illegal_characters, which runs after \n, \r and \t
+    # have become two-character escapes, so those count as text rather than whitespace here.
+    cdef Py_UCS4 ch
+    while j < n:
+        ch = s[j]
+        if ch == u'\n' or ch == u'\r' or ch == u'\t' or not Py_UNICODE_ISSPACE(ch):
+            return ch == u':' or ch == u',' or ch == u'}' or ch == u']'
+        j += 1
+    return True
+
+
+cpdef str escape_illegal(str s):
+    """ Escape backslashes, newlines, carriage returns, tabs and embedded double quotes. """
+    cdef Py_ssize_t n = len(s)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t k = 0
+    cdef Py_UCS4 ch
+    cdef bint in_string = False
+    cdef Py_UCS4* out = <Py_UCS4*> PyMem_Malloc((2 * n + 1) * sizeof(Py_UCS4))
+    if out is NULL:
+        raise MemoryError()
+
+    try:
+        for i in range(n):
+            ch = s[i]
+            if ch == u'\\':
+                out[k] = u'\\'
+                out[k + 1] = u'\\'
+                k += 2
+            elif ch == u'\n':
+                out[k] = u'\\'
+                out[k + 1] = u'n'
+                k += 2
+            elif ch == u'\r':
+                out[k] = u'\\'
+                out[k + 1] = u'r'
+                k += 2
+            elif ch == u'\t':
+                out[k] = u'\\'
+                out[k + 1] = u't'
+                k += 2
+            elif ch == u'"':
+                if not in_string:
+                    in_string = True
+                    out[k] = u'"'
+                    k += 1
+                elif _is_string_end(s, i + 1, n):
+                    in_string = False
+                    out[k] = u'"'
+                    k += 1
+                else:
+                    out[k] = u'\\'
+                    out[k + 1] = u'"'
+                    k += 2
+            else:
+                out[k] = ch
+                k += 1
+        return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, out, k)
+    finally:
+        PyMem_Free(out)
+
+
+cpdef str ensure_brackets(str s):
+    """ Drop mismatched closing brackets and close any open string and brackets. """
+    cdef Py_ssize_t n = len(s)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t k = 0
+    cdef Py_ssize_t depth = 0
+    cdef Py_UCS4 ch
+    cdef Py_UCS4 in_string = 0
+    cdef bint escape = False
+    cdef Py_UCS4* out = <Py_UCS4*> PyMem_Malloc((2 * n + 1) * sizeof(Py_UCS4))
+    cdef Py_UCS4* stack = <Py_UCS4*> PyMem_Malloc((n + 1) * sizeof(Py_UCS4))
+    if out is NULL or stack is NULL:
+        PyMem_Free(out)
+        PyMem_Free(stack)
+        raise MemoryError()
+
+    try:
+        for i in range(n):
+            ch = s[i]
+            out[k] = ch
+            k += 1
+            if escape:
+                escape = False
+            elif ch == u'\\':
+                escape = True
+            elif ch == u'"' or ch == u"'":
+                if not in_string:
+                    in_string = ch
+                elif in_string == ch:
+                    in_string = 0
+            elif in_string:
+                continue
+            elif ch == u'{' or ch == u'[':
+                stack[depth] = ch
+                depth += 1
+            elif ch == u'}' or ch == u']':
+                if depth and stack[depth - 1] == (u'{' if ch == u'}' else u'['):
+                    depth -= 1
+                else:
+                    # Mismatched closing bracket, remove it
+                    k -= 1
+
+        if in_string:
+            out[k] = in_string
+            k += 1
+        while depth:
+            depth -= 1
+            out[k] = u'}' if stack[depth] == u'{' else u']'
+            k += 1
+        return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, out, k)
+    finally:
+        PyMem_Free(out)
+        PyMem_Free(stack)
@@ -1,5 +1,5 @@
 import logging as logger
-from typing import Any, List, Dict
+from typing import Any, Callable, List, Dict
 from dataclasses import dataclass, field
 
 
@@ -12,6 +12,10 @@ class SchemaType:
     NULL = type(None)
 
 
+def _to_number(data: str) -> int | float:
+    return float(data) if '.' in data else int(data)
+
+
 @dataclass
 class Schema:
     type: type[dict] | type[list] | type[str] | type[float] | type[int] | type[bool] | type[None]
@@ -19,76 +23,112 @@ class Schema:
     items: Any = None  # For array schemas
     required: List[str] = field(default_factory=list)
 
-    def validated(self, data: Any) -> Any:
-        original_data = data  # Keep original for debugging
+    def __post_init__(self):
+        # Only state derived from `type` is cached; `properties`, `required` and `items` are read on
+        # every call, so changing them in place (e.g. schema.required.append(...)) takes effect.
 
-        # OBJECT TYPE
+        # Converter applied to strings given for a primitive type; resolved here so the hot path
+        # is one attribute read instead of comparing the type on every value.
+        self._convert = _to_number if self.type == SchemaType.NUMBER else self.type
+        # Resolve the type dispatch once, so validating nested values and array items goes straight to the
+        # specialized validator. The plain function is stored, not a bound method, so copies of a schema
+        # validate with their own fields. Subclasses that override `validated` keep their override.
+        if type(self).validated is Schema.validated:
+            self._validate = self._validator()
+        else:
+            self._validate = type(self).validated
+        # Primitive leaves are settled inline by the parent's loop when no conversion is needed,
+        # which saves a call frame per leaf value; None for containers and overridden validators.
+        self._leaf_type = self.type if self._validate is type(self)._validate_primitive else None
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        # Reassigning the type after construction rebuilds the cached validator state
+        if name == 'type' and '_leaf_type' in self.__dict__:
+            self.__post_init__()
+
+    def _validator(self) -> Callable[['Schema', Any], Any]:
         if self.type == SchemaType.OBJECT:
-            # if data is formatted as an array, but an object is expected
-            if isinstance(data, SchemaType.ARRAY):
-                if not data:
-                    return None
-                data = data[0]
+            return type(self)._validate_object
+        elif self.type == SchemaType.ARRAY:
+            return type(self)._validate_array
+        return type(self)._validate_primitive
+
+    def validated(self, data: Any) -> Any:
+        return self._validator()(self, data)
 
-            if not isinstance(data, self.type):
+    def _validate_object(self, data: Any) -> Any:
+        original_data = data  # Keep original for debugging
+
+        # if data is formatted as an array, but an object is expected
+        if isinstance(data, SchemaType.ARRAY):
+            if not data:
                 return None
+            data = data[0]
+
+        if not isinstance(data, self.type):
+            return None
 
-            # Check required fields
-            if self.required:
-                missing_fields = [key for key in self.required if key not in data]
-                if missing_fields:
+        # Check required fields
+        if self.required:
+            for key in self.required:
+                if key not in data:
+                    missing_fields = [key for key in self.required if key not in data]
                     logger.log(
                         logger.DEBUG,
                         f"Validation failed: Missing required fields {missing_fields} in data {original_data}"
                     )
                     return None
-            else:
-                # If no 'required', ensure at least one known property is present
-                if not any(key in data for key in self.properties.keys()):
-                    logger.log(logger.DEBUG, f"Validation failed: No properties found in data {original_data}")
-                    return None
-
-            # Recursively validate properties if present
-            for key, sub_schema in self.properties.items():
-                if key in data:
-                    value = sub_schema.validated(data[key])
-                    if value is None:
-                        logger.log(
-                            logger.DEBUG,
-                            f"Validation failed: sub-Schema validation failed for '{key}' = {data[key]}"
-                        )
-                        return None
-                    else:
-                        data[key] = value
-            return data
+        else:
+            # If no 'required', ensure at least one known property is present
+            if data.keys().isdisjoint(self.properties):
+                logger.log(logger.DEBUG, f"Validation failed: No properties found in data {original_data}")
+                return None
 
-        # ARRAY TYPE
-        elif self.type == SchemaType.ARRAY:
-            # if data is formatted as an object, but an array is expected
-            if isinstance(data, SchemaType.OBJECT):
-                if not data:
+        # Recursively validate properties if present
+        for key, sub_schema in self.properties.items():
+            if key in data:
+                value = data[key]
+                leaf_type = sub_schema._leaf_type
+                if leaf_type is None or (isinstance(value, str) and not isinstance(value, leaf_type)):
+                    value = sub_schema._validate(sub_schema, value)
+                if value is None:
+                    logger.log(
+                        logger.DEBUG,
+                        f"Validation failed: sub-Schema validation failed for '{key}' = {data[key]}"
+                    )
                     return None
-                data = [data]
+                else:
+                    data[key] = value
+        return data
 
-            if not isinstance(data, self.type):
+    def _validate_array(self, data: Any) -> Any:
+        # if data is formatted as an object, but an array is expected
+        if isinstance(data, SchemaType.OBJECT):
+            if not data:
                 return None
+            data = [data]
+
+        if not isinstance(data, self.type):
+            return None
 
-            if self.items:
-                for item in data:
-                    if not self.items.validated(item):
+        if self.items:
+            items = self.items
+            leaf_type = items._leaf_type
+            validate = items._validate
+            for item in data:
+                if leaf_type is not None and (isinstance(item, leaf_type) or not isinstance(item, str)):
+                    if not item:
                         return None
-            return data
+                elif not validate(items, item):
+                    return None
+        return data
 
-        # BASIC TYPE CHECKS
+    def _validate_primitive(self, data: Any) -> Any:
+        if isinstance(data, str) and not isinstance(data, self.type):
+            try:
+                return self._convert(data)
+            except TypeError:
+                return None
         else:
-            class_type = self.type
-            if not isinstance(data, class_type) and isinstance(data, str):
-                try:
-                    # Handle tuple case explicitly for number conversion
-                    if self.type == SchemaType.NUMBER:
-                        class_type = float if '.' in data else int
-                    return class_type(data)
-                except TypeError:
-                    return None
-            else:
-                return data
+            return data
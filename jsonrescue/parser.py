@@ -1,41 +1,229 @@
-import json
-import regex
 import re
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Iterator, List, Tuple
+from json import loads as _json_loads
 from json.decoder import JSONDecodeError
 from .custom_schema import Schema
 
-_JSON_PATTERN = r"""
-    (?P<BRACE_BRACKET>
-        \{
-            (?: [^{}] | (?&BRACE_BRACKET) )*
-        \}
-        |
-        \[
-            (?: [^\[\]] | (?&BRACE_BRACKET) )*
-        \]
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:  # orjson not installed, Parser(fast_decode=True) is unavailable
+    _orjson_loads = None
+
+try:
+    from . import _fastpath
+except ImportError:  # extension not built, use the pure-Python methods
+    _fastpath = None
+
+_KEY_RE = re.compile(r'([{,]\s*)([A-Za-z0-9_\']+)\s*:')
+# A value runs up to the next , ] or }; literals, numbers and single-quoted strings must span all of it
+_VALUE_RE = re.compile(r'''
+    (?P<prefix> :\s* )
+    (?:
+        (?P<literal> true|false|null | -?\d+(?:\.\d+)? ) \s* (?=[,\]}]|\Z)
+        | (?P<single> '(?:[^,\]}]*')? ) \s* (?=[,\]}]|\Z)
+        | (?P<bare> [^{\[\]",}\s][^,\]}]* )
     )
-"""
-BRACE_BRACKET = regex.compile(_JSON_PATTERN, regex.VERBOSE | regex.MULTILINE)
+''', re.VERBOSE)
+_OBJ_ADJ_RE = re.compile(r'}\s*{')
+_ARR_ADJ_RE = re.compile(r'\]\s*\[')
+
+# Byte classes for ensure_ending_brackets
+_ACT_ESCAPE, _ACT_QUOTE, _ACT_OPEN, _ACT_CLOSE = 1, 2, 3, 4
+_ACTION = bytearray(256)
+_ACTION[ord('\\')] = _ACT_ESCAPE
+_ACTION[ord('"')] = _ACTION[ord("'")] = _ACT_QUOTE
+_ACTION[ord('{')] = _ACTION[ord('[')] = _ACT_OPEN
+_ACTION[ord('}')] = _ACTION[ord(']')] = _ACT_CLOSE
+_CLOSER_OF = {ord('{'): ord('}'), ord('['): ord(']')}
+_OPENER_OF = {ord('}'): ord('{'), ord(']'): ord('[')}
+
+# Characters that may follow a closing quote in escape_illegal_characters
+_END_OF_STR = frozenset(':,}]')
+
+_OPENER_OF_CLOSER = {'}': '{', ']': '['}
+_BRACKET_TOKEN_RE = re.compile(r'[{}\[\]]')
+_GROUP_TOKEN_RE = re.compile(r'''\\.|[{}\[\]"']''', re.DOTALL)
+# A quote only closes a string when followed by a delimiter, as in _REPAIR_RE and escape_illegal_characters
+_STRING_END_RE = re.compile(r'\s*(?:[:,}\]]|\Z)')
+
+
+def _group_spans(text: str, skip_strings: bool) -> Tuple[List[Tuple[int, int]], bool]:
+    """
+    Return the ``(start, end)`` spans of the top-level ``{...}`` / ``[...]`` groups in the text, and whether
+    any opener was left unclosed.
+    One left-to-right pass keeps a stack of open brackets. Each closed group is recorded under the bracket
+    enclosing it, so the groups inside an opener that never closes are still returned.
+    A closer closes the nearest opener of its own type (and any mismatched openers above it) and is
+    ignored when there is none.
+    With ``skip_strings``, brackets inside single- or double-quoted strings within a group are ignored;
+    a quote not followed by a delimiter stays part of the string.
+    """
+    tokens = _GROUP_TOKEN_RE if skip_strings else _BRACKET_TOKEN_RE
+    spans = []
+    # Each entry is (opener, start, closed groups directly inside it)
+    stack = []
+    open_count = {'{': 0, '[': 0}
+    quote = None
+
+    for match in tokens.finditer(text):
+        char = match.group()
+        if quote is not None:
+            if char == quote and _STRING_END_RE.match(text, match.end()):
+                quote = None
+        elif char in open_count:
+            stack.append((char, match.start(), []))
+            open_count[char] += 1
+        elif char in _OPENER_OF_CLOSER:
+            opener = _OPENER_OF_CLOSER[char]
+            if not open_count[opener]:
+                continue
+            while True:
+                popped, start, _ = stack.pop()
+                open_count[popped] -= 1
+                if popped == opener:
+                    break
+            (stack[-1][2] if stack else spans).append((start, match.end()))
+        elif stack and (char == '"' or char == "'"):
+            # Quotes only delimit strings inside a group; prose between groups is skipped
+            quote = char
+
+    for _, _, children in stack:
+        spans.extend(children)
+    return spans, bool(stack)
+
+
+def _bracket_groups(text: str) -> List[str]:
+    """
+    Return every top-level bracket group in the text, ignoring brackets inside strings.
+    If quoting is too broken for some group to close, the groups found counting brackets only
+    are added wherever they do not overlap a group already found.
+    """
+    spans, unclosed = _group_spans(text, True)
+    if unclosed:
+        found = spans
+        spans = []
+        i = 0
+        for start, end in _group_spans(text, False)[0]:
+            while i < len(found) and found[i][1] <= start:
+                spans.append(found[i])
+                i += 1
+            if i == len(found) or end <= found[i][0]:
+                spans.append((start, end))
+        spans.extend(found[i:])
+    return [text[start:end] for start, end in spans]
+
+
+# Collapses whitespace runs to one space, matching only runs that are not already a single space
+_COLLAPSE_WS_RE = re.compile(r'\s{2,}|[^\S ]')
+_REPAIR_RE = re.compile(r'''
+    # A quote only closes a string when followed by a delimiter; other quotes stay inside it
+    (?P<string> " (?: [^"]+ | "(?!\s*(?:[:,}\]]|\Z)) )* "? )
+    | (?P<key> [{,] (?P<key_space>\s*) (?P<key_name>[A-Za-z0-9_']+) \s* (?=:) )
+    # Literals and numbers spanning the whole value are left for the engine to copy, without a callback
+    | (?P<value> : (?P<value_space>\s*)
+        (?! (?:true|false|null|-?\d+(?:\.\d+)?) \s* (?:[,\]}]|\Z) )
+        (?P<value_text>[^{\[\]",}\s][^,\]}]*) )
+    | (?P<adjacent> }\s*(?={) | \]\s*(?=\[) )
+    | (?P<space> \s{2,} | [^\S ] )
+    | (?P<backslash> \\ )
+''', re.VERBOSE)
+
+
+def _escape_string_body(body: str) -> str:
+    """ Collapse whitespace and escape backslashes and quotes inside a string's contents. """
+    # Any whitespace other than a plain space is non-printable, so most bodies skip the regex
+    if '  ' in body or not body.isprintable():
+        body = _COLLAPSE_WS_RE.sub(' ', body)
+    return body.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _quote_bare_value(value: str) -> str:
+    """ Render a collapsed, stripped bare (non-literal) value the way fix_string_values would. """
+    if value.startswith("'") and value.endswith("'"):
+        value = value[1:-1]
+    return '"' + _escape_string_body(value) + '"'
+
+
+def _repair(match) -> str:
+    """ Replacement callback for _REPAIR_RE, dispatching on the alternative that matched. """
+    kind = match.lastgroup
+    if kind == 'string':
+        token = match.group()
+        if len(token) > 1 and token[-1] == '"':
+            return '"' + _escape_string_body(token[1:-1]) + '"'
+        # Unterminated string running to the end of the candidate
+        return '"' + _escape_string_body(token[1:])
+    if kind == 'key':
+        key = match.group('key_name')
+        if key.startswith("'") and key.endswith("'"):
+            key = key[1:-1]
+        lead = match.group()[0]
+        return f'{lead} "{key}"' if match.group('key_space') else f'{lead}"{key}"'
+    if kind == 'value':
+        value = _quote_bare_value(_COLLAPSE_WS_RE.sub(' ', match.group('value_text')).strip())
+        return ': ' + value if match.group('value_space') else ':' + value
+    if kind == 'adjacent':
+        return match.group()[0] + ','
+    if kind == 'space':
+        return ' '
+    return '\\\\'
+
+
+def _rewrite(json_str: str) -> str:
+    """
+    Apply all of the fix_json repairs in one regex traversal of the candidate:
+    whitespace collapsing, key quoting, bare value quoting, escaping and comma insertion.
+    Quoted strings are consumed whole, so unlike the standalone fix methods,
+    key and value fixes are never applied inside them.
+    """
+    return _REPAIR_RE.sub(_repair, json_str).strip()
+
+
+# _rewrite is pure, so repeated candidates (common when re-parsing similar model output) are repaired once.
+# The least recently used entry is evicted once 512 candidates are held; long-running processes that see
+# very large candidates can release them with _fix_json.cache_clear().
+_fix_json = lru_cache(maxsize=512)(_rewrite)
+
+
+def _fast_loads(text: str) -> Any:
+    """
+    Decode with orjson, for Parser(fast_decode=True).
+    Text orjson rejects but json accepts (NaN, Infinity, out-of-range floats, lone surrogates)
+    is retried with json, so it is never sent to the repair path.
+    orjson's JSONDecodeError subclasses the standard library's, so callers catch both the same way.
+    """
+    try:
+        return _orjson_loads(text)
+    except JSONDecodeError:
+        return _json_loads(text)
+
+
+# Returned by Parser._decode for a candidate that cannot be decoded, since null is a valid result
+_UNDECODABLE = object()
 
 
 class Parser:
-    def __init__(self, schema: Schema = None):
+    def __init__(self, schema: Schema = None, fast_decode: bool = False):
+        """
+        With ``fast_decode``, text that is already valid JSON is decoded with orjson, which must be installed.
+        orjson turns integers wider than 64 bits into floats, so it is opt-in.
+        Candidates that needed extracting or repair are always decoded with the standard library.
+        """
+        if fast_decode and _orjson_loads is None:
+            raise ImportError("fast_decode requires orjson: pip install jsonrescue[orjson]")
         self.schema = schema
+        self.fast_decode = fast_decode
 
     def rescue(self, text: str) -> Any:
         try:
-            result = json.loads(text)
+            result = _fast_loads(text) if self.fast_decode else _json_loads(text)
             return self.schema.validated(result) if self.schema else result
         except JSONDecodeError:
             results = []
             json_candidates = self.extract_json_candidates(text)
             for candidate in json_candidates:
-                fixed_json = self.fix_json(candidate)
-                if not fixed_json:
-                    continue
-                try:
-                    loaded = json.loads(fixed_json)
+                for loaded in self._iter_loaded(candidate):
                     if self.schema:
                         validated_data = self.schema.validated(loaded)
                         if validated_data is not None:
@@ -45,43 +233,76 @@ class Parser:
                             results.extend(loaded)
                         else:
                             results.append(loaded)
-                except JSONDecodeError:
-                    continue
             if len(results) > 0:
                 return results if len(results) > 1 else results[0]
 
         return None
 
+    def _iter_loaded(self, candidate: str) -> Iterator[Any]:
+        """
+        Yield the decoded candidate, repairing it with fix_json if needed.
+        If it still fails and counting brackets only splits it into several groups (an unterminated
+        quote made it swallow its neighbours), each of those groups is decoded instead.
+        """
+        loaded = self._decode(candidate)
+        if loaded is not _UNDECODABLE:
+            yield loaded
+            return
+        spans = _group_spans(candidate, False)[0]
+        if spans == [(0, len(candidate))]:
+            return
+        for start, end in spans:
+            loaded = self._decode(candidate[start:end])
+            if loaded is not _UNDECODABLE:
+                yield loaded
+
+    def _decode(self, candidate: str) -> Any:
+        """ Decode a candidate as-is or after fix_json, returning _UNDECODABLE if neither works. """
+        try:
+            # Well-formed candidates (e.g. JSON surrounded by prose) need no repair
+            return _json_loads(candidate)
+        except JSONDecodeError:
+            # Nothing to repair into an object or array; skip the fix pass entirely
+            if '{' not in candidate and '[' not in candidate:
+                return _UNDECODABLE
+            fixed_json = self.fix_json(candidate)
+            if not fixed_json:
+                return _UNDECODABLE
+            try:
+                return _json_loads(fixed_json)
+            except JSONDecodeError:
+                return _UNDECODABLE
+
     def extract_json_candidates(self, text: str) -> List[str]:
         """
-        Extract potential JSON-like substrings from the text using a bracket-matching regex.
+        Extract potential JSON-like substrings from the text using a single-pass bracket scanner.
         Falls back to fixing the entire text if no well-formed bracket pair is found.
         """
+        # Without an opening bracket there is no candidate; skip counting and fixing the whole text
+        if '{' not in text and '[' not in text:
+            return []
         missing_curly = abs(text.count('{') - text.count('}'))
         missing_square = abs(text.count('[') - text.count(']'))
         if missing_curly > 0 or missing_square > 0:
             # Return a corrected text with ensured brackets
             text = self.ensure_ending_brackets(text)
-        candidates = BRACE_BRACKET.findall(text)
+        candidates = _bracket_groups(text)
         return candidates
 
     def fix_json(self, json_str: str) -> str:
-        """ Sequentially attempt fixes on a JSON candidate. """
-        json_str = re.sub(r'\s+', ' ', json_str).strip()
-        json_str = self.fix_keys(json_str)
-        # Fix unquoted string values (now handles multi-word)
-        json_str = self.fix_string_values(json_str)
-        # Escape illegal characters (including inner double quotes)
-        json_str = self.escape_illegal_characters(json_str)
-        # Insert commas between adjacent objects/arrays
-        json_str = self.insert_missing_commas(json_str)
-        return json_str
+        """
+        Attempt all fixes on a JSON candidate in a single pass: whitespace collapsing, key quoting,
+        bare value quoting, escaping and comma insertion.
+        Quoted strings are consumed whole, so key and value fixes are never applied inside them; the output
+        can therefore differ from running fix_keys, fix_string_values, escape_illegal_characters and
+        insert_missing_commas in sequence, which may rewrite text inside strings.
+        Results are cached for the 512 most recently fixed candidates.
+        """
+        return _fix_json(json_str)
 
     @staticmethod
     def fix_keys(json_str: str) -> str:
         """Add quotes around unquoted object keys."""
-        pattern = re.compile(r'([{,]\s*)([A-Za-z0-9_\']+)\s*:')
-
         def replace(match):
             prefix = match.group(1)
             key = match.group(2)
@@ -93,8 +314,7 @@ class Parser:
 
             return f'{prefix}"{key}":'
 
-        fixed_json_str = pattern.sub(replace, json_str)
-        return fixed_json_str
+        return _KEY_RE.sub(replace, json_str)
 
     @staticmethod
     def fix_string_values(json_str: str) -> str:
@@ -102,71 +322,74 @@ class Parser:
         Add quotes around unquoted string values, allowing for multi-word tokens.
         This finds substrings after a colon that appear before a comma, brace, or bracket.
         """
-        pattern = re.compile(r'(:\s*)([^{\[\]",}\]\s][^,\]}]*)')
-
         def replace(match):
-            prefix = match.group(1)
-            value = match.group(2).strip()
+            prefix = match.group('prefix')
+            kind = match.lastgroup
+            value = match.group(kind)
 
-            # Check if value is valid JSON literal (true, false, null) or a number
-            if re.match(r'^(true|false|null)$', value):
-                return prefix + value
-            if re.match(r'^-?\d+(\.\d+)?$', value):
+            # Valid JSON literal (true, false, null) or a number
+            if kind == 'literal':
                 return prefix + value
             # In single quotes?
-            if value.startswith("'") and value.endswith("'"):
+            if kind == 'single':
                 return prefix + f"\"{value[1:-1]}\""
-            # Already in quotes?
-            if value.startswith('"') and value.endswith('"'):
-                return prefix + value
 
             # Otherwise, wrap in quotes
-            return prefix + f'"{value}"'
+            return prefix + f'"{value.rstrip()}"'
 
-        return pattern.sub(replace, json_str)
+        return _VALUE_RE.sub(replace, json_str)
 
     @staticmethod
     def escape_illegal_characters(json_str: str) -> str:
         """
         Escape problematic characters (newlines, tabs, backslashes, plus internal quotes).
         """
-        # Escape backslashes first
+        if _fastpath is not None:
+            return _fastpath.escape_illegal(json_str)
+
+        # Escape backslashes first. Chained str.replace calls are kept on purpose: each is a fast C scan
+        # that returns the string untouched when there is nothing to replace, whereas str.translate with
+        # multi-character replacements falls back to a per-character path that is far slower.
         json_str = json_str.replace('\\', '\\\\')
         # Escape common control characters
         json_str = json_str.replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
 
-        # Escape unescaped double quotes inside strings
+        # Escape unescaped double quotes inside strings.
+        # Only quotes change state, so copy everything between them as whole slices.
+        # (A bytearray over the UTF-8 encoding measured slower: the encode/decode round trip
+        # costs more than joining these few slices.)
         result = []
         length = len(json_str)
         in_string = False
         i = 0
 
         while i < length:
-            char = json_str[i]
-            if char == '"':
-                if not in_string:
-                    # Not in a string, so this quote starts one
-                    in_string = True
+            quote = json_str.find('"', i)
+            if quote < 0:
+                result.append(json_str[i:])
+                break
+            result.append(json_str[i:quote])
+
+            if not in_string:
+                # Not in a string, so this quote starts one
+                in_string = True
+                result.append('"')
+            else:
+                # Already in a string; decide if this quote ends or should be escaped
+                # Look ahead for next non-whitespace
+                j = quote + 1
+                while j < length and json_str[j].isspace():
+                    j += 1
+
+                if j >= length or json_str[j] in _END_OF_STR:
+                    # Valid end of string
+                    in_string = False
                     result.append('"')
                 else:
-                    # Already in a string; decide if this quote ends or should be escaped
-                    # Look ahead for next non-whitespace
-                    j = i + 1
-                    while j < length and json_str[j].isspace():
-                        j += 1
-
-                    if j >= length or json_str[j] in [':', ',', '}', ']']:
-                        # Valid end of string
-                        in_string = False
-                        result.append('"')
-                    else:
-                        # Embedded quote -> escape it
-                        result.append('\\"')
-            else:
-                # Normal character, just add it
-                result.append(char)
+                    # Embedded quote -> escape it
+                    result.append('\\"')
 
-            i += 1
+            i = quote + 1
 
         return "".join(result)
 
@@ -175,39 +398,41 @@ class Parser:
         """
         Add missing closing brackets/braces to a JSON-like string.
         """
+        if _fastpath is not None:
+            return _fastpath.ensure_brackets(json_str)
+
+        # Walk the UTF-8 bytes and classify each one with _ACTION; every byte of a multi-byte
+        # character is >= 0x80, so it can never be mistaken for one of the ASCII actions.
+        source = json_str.encode('utf-8', 'surrogatepass')
         stack = []
-        opening_brackets = {'{': '}', '[': ']'}
-        closing_brackets = {'}': '{', ']': '['}
-        result = []
-        in_string = False
+        result = bytearray()
+        in_string = 0
         escape = False
 
-        for char in json_str:
-            result.append(char)
+        for byte in source:
+            result.append(byte)
             if escape:
                 escape = False
                 continue
-            if char == '\\':
-                escape = True
+            action = _ACTION[byte]
+            if not action:
                 continue
-            if char == '"' or char == "'":
+            if action == _ACT_ESCAPE:
+                escape = True
+            elif action == _ACT_QUOTE:
                 if not in_string:
-                    in_string = char
-                elif in_string == char:
-                    in_string = False
-                continue
-
-            if in_string:
+                    in_string = byte
+                elif in_string == byte:
+                    in_string = 0
+            elif in_string:
                 continue
-
-            if char in opening_brackets:
-                stack.append(char)
-            elif char in closing_brackets:
-                if stack and stack[-1] == closing_brackets[char]:
-                    stack.pop()
-                else:
-                    # Mismatched closing bracket, remove it
-                    result.pop()
+            elif action == _ACT_OPEN:
+                stack.append(byte)
+            elif stack and stack[-1] == _OPENER_OF[byte]:
+                stack.pop()
+            else:
+                # Mismatched closing bracket, remove it
+                result.pop()
 
         # Close string if still inside one
         if in_string:
@@ -216,9 +441,9 @@ class Parser:
         # Close any unclosed brackets
         while stack:
             opening = stack.pop()
-            result.append(opening_brackets[opening])
+            result.append(_CLOSER_OF[opening])
 
-        return ''.join(result)
+        return result.decode('utf-8', 'surrogatepass')
 
     @staticmethod
     def insert_missing_commas(json_str: str) -> str:
@@ -226,9 +451,9 @@ class Parser:
         Insert commas between adjacent objects/arrays
         """
         # Insert commas between adjacent objects
-        json_str = re.sub(r'}\s*{', '},{', json_str)
+        json_str = _OBJ_ADJ_RE.sub('},{', json_str)
         # Insert commas between adjacent arrays
-        json_str = re.sub(r'\]\s*\[', '],[', json_str)
+        json_str = _ARR_ADJ_RE.sub('],[', json_str)
 
         # Insert comma between a value and the next key, if missing
         # e.g. "... value "next_key": ..." -> "... value, "next_key": ..."
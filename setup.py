@@ -1,4 +1,15 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+# The compiled fast path is optional; without Cython (or a compiler) the pure-Python parser is used
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("jsonrescue._fastpath", ["jsonrescue/_fastpath.pyx"], optional=True)],
+        language_level=3,
+    )
 
 setup(
     name='jsonrescue',
@@ -12,10 +23,11 @@ setup(
     license="MIT",
     packages=find_packages(),
     include_package_data=True,
-    package_data={"jsonrescue": ["*.py"]},
-    install_requires=[
-        "regex",
-    ],
+    package_data={"jsonrescue": ["*.py", "*.pyx"]},
+    ext_modules=ext_modules,
+    extras_require={
+        "orjson": ["orjson"],
+    },
     python_requires=">=3.7",
     classifiers=[
         "Programming Language :: Python :: 3",
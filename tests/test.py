@@ -1,4 +1,8 @@
+import copy
+import math
 import unittest
+from unittest import mock
+from jsonrescue import parser as parser_module
 from jsonrescue.parser import Parser
 from jsonrescue.custom_schema import Schema, SchemaType
 
@@ -86,6 +90,12 @@ class TestParser(unittest.TestCase):
         self.assertIsNone(parser_schema_array_with_no_item_req.rescue(input_text))
         self.assertIsNone(parser_no_schema.rescue(input_text))
 
+    def test_only_closing_brackets(self):
+        input_text = 'All done} see you]'
+        self.assertEqual(parser_no_schema.extract_json_candidates(input_text), [])
+        self.assertIsNone(parser_schema_object_req.rescue(input_text))
+        self.assertIsNone(parser_no_schema.rescue(input_text))
+
     def test_json_with_surrounding_text(self):
         input_text = 'Here is the data\n{"name": "Jane", "age":25, "emails":["jane@example.com"]} Thanks!'
         expected = {"name": "Jane", "age": 25, "emails": ["jane@example.com"]}
@@ -95,6 +105,15 @@ class TestParser(unittest.TestCase):
         self.assertEqual(parser_schema_array_with_no_item_req.rescue(input_text), [expected])
         self.assertEqual(parser_no_schema.rescue(input_text), expected)
 
+    def test_valid_json_with_surrounding_text_is_unchanged(self):
+        input_text = 'Result:\n{"name": "Lee  Park", "age": 52, "emails": ["lee@example.com"], "note": "a\\tb"} ok'
+        expected = {"name": "Lee  Park", "age": 52, "emails": ["lee@example.com"], "note": "a\tb"}
+        self.assertEqual(parser_schema_object_req.rescue(input_text), expected)
+        self.assertEqual(parser_schema_object_no_req.rescue(input_text), expected)
+        self.assertEqual(parser_schema_array_with_item_req.rescue(input_text), [expected])
+        self.assertEqual(parser_schema_array_with_no_item_req.rescue(input_text), [expected])
+        self.assertEqual(parser_no_schema.rescue(input_text), expected)
+
     def test_multiple_objects(self):
         input_text = ('Here\'s a test {"test":"Hello World","foo": "bar"}{"name":"Dana","age":27,"emails":['
                       '"dana@example.com"]}')
@@ -109,6 +128,37 @@ class TestParser(unittest.TestCase):
         self.assertEqual(parser_schema_array_with_no_item_req.rescue(input_text), [expected])
         self.assertEqual(parser_no_schema.rescue(input_text), full_json_expected)
 
+    def test_brackets_inside_strings(self):
+        input_text = 'Result: {"name": "Eve} [test]", "age": 40, "emails": ["eve@example.com"]} done'
+        expected = {"name": "Eve} [test]", "age": 40, "emails": ["eve@example.com"]}
+        self.assertEqual(parser_schema_object_req.rescue(input_text), expected)
+        self.assertEqual(parser_schema_object_no_req.rescue(input_text), expected)
+        self.assertEqual(parser_schema_array_with_item_req.rescue(input_text), [expected])
+        self.assertEqual(parser_schema_array_with_no_item_req.rescue(input_text), [expected])
+        self.assertEqual(parser_no_schema.rescue(input_text), expected)
+
+    def test_unescaped_quotes_in_multiple_objects(self):
+        input_text = '{"a": "x"y"} {"b": "z"w"}'
+        self.assertEqual(parser_no_schema.rescue(input_text), [{"a": 'x"y'}, {"b": 'z"w'}])
+
+        input_text = '{"q": "5" tall"} then {"r": "1"} and {"s": "2" x"}'
+        self.assertEqual(parser_no_schema.rescue(input_text), [{"q": '5" tall'}, {"r": "1"}, {"s": '2" x'}])
+
+        input_text = ' '.join('{"k%d": "a"b"}' % i for i in range(2000))
+        self.assertEqual(len(parser_no_schema.extract_json_candidates(input_text)), 2000)
+
+    def test_quotes_inside_single_quoted_strings(self):
+        input_text = '{\'a\': \'say "hi"\'} {"b": 1}'
+        self.assertEqual(parser_no_schema.rescue(input_text), [{'a': 'say "hi"'}, {'b': 1}])
+
+    def test_missing_comma_after_string(self):
+        input_text = '{"a": "x" b: 1} {"c": "y"}'
+        self.assertEqual(parser_no_schema.rescue(input_text), {'c': 'y'})
+
+    def test_unterminated_quote(self):
+        input_text = "{note: Bob's shop, x: 1} then {\"y\": 2}"
+        self.assertEqual(parser_no_schema.rescue(input_text), [{'note': "Bob's shop", 'x': 1}, {'y': 2}])
+
     def test_missing_quotes(self):
         input_text = '{"name": John Doe, age: 22, \'emails\': ["john.doe@example.com"], "test": Hello World}'
         expected = {"name": "John Doe", "age": 22, "emails": ["john.doe@example.com"], "test": "Hello World"}
@@ -118,6 +168,15 @@ class TestParser(unittest.TestCase):
         self.assertEqual(parser_schema_array_with_no_item_req.rescue(input_text), [expected])
         self.assertEqual(parser_no_schema.rescue(input_text), expected)
 
+    def test_delimiters_inside_strings(self):
+        input_text = '{name: Kim, age: 41, emails: ["kim@example.com"], "note": "meet at 10:30, room: 4"}'
+        expected = {"name": "Kim", "age": 41, "emails": ["kim@example.com"], "note": "meet at 10:30, room: 4"}
+        self.assertEqual(parser_schema_object_req.rescue(input_text), expected)
+        self.assertEqual(parser_schema_object_no_req.rescue(input_text), expected)
+        self.assertEqual(parser_schema_array_with_item_req.rescue(input_text), [expected])
+        self.assertEqual(parser_schema_array_with_no_item_req.rescue(input_text), [expected])
+        self.assertEqual(parser_no_schema.rescue(input_text), expected)
+
     def test_missing_single_ending(self):
         input_text = 'Start {"name": "Bob", "age": 35, "emails": ["bob@example.com'
         expected = {"name": "Bob", "age": 35, "emails": ["bob@example.com"]}
@@ -154,5 +213,76 @@ class TestParser(unittest.TestCase):
         self.assertEqual(parser_no_schema.rescue(input_text), expected)
 
 
+class TestSchema(unittest.TestCase):
+    def test_reassigned_fields_are_recompiled(self):
+        schema = Schema(type=SchemaType.OBJECT, properties={'name': Schema(type=SchemaType.STRING)})
+        self.assertEqual(schema.validated({'name': 'Ann'}), {'name': 'Ann'})
+        schema.required = ['age']
+        self.assertIsNone(schema.validated({'name': 'Ann'}))
+        schema.type = SchemaType.ARRAY
+        self.assertEqual(schema.validated({'name': 'Ann'}), [{'name': 'Ann'}])
+
+    def test_copies_validate_with_their_own_fields(self):
+        schema = Schema(type=SchemaType.OBJECT, properties={'a': Schema(type=SchemaType.NUMBER)})
+        copied = copy.copy(schema)
+        copied.required = ['zzz']
+        self.assertIsNone(copied.validated({'a': '3'}))
+        self.assertEqual(schema.validated({'a': '3'}), {'a': 3})
+
+    def test_fields_changed_in_place_are_used(self):
+        schema = Schema(type=SchemaType.OBJECT, properties={'name': Schema(type=SchemaType.STRING)})
+        schema.properties['b'] = Schema(type=SchemaType.NUMBER)
+        self.assertEqual(schema.validated({'b': '3'}), {'b': 3})
+        schema.required.append('name')
+        self.assertIsNone(schema.validated({'b': '3'}))
+
+
+@unittest.skipIf(parser_module._fastpath is None, "compiled fast path not built")
+class TestFastPath(unittest.TestCase):
+    samples = [
+        '{"name": "John "Deere" Doe", "age": 30}',
+        'Start {"name": "Bob", "emails": ["bob@example.com',
+        '{"a": "tab\there", "b": "back\\slash \\" end"}]',
+        "{'single': [1, 2}, \"x\": \u00e9\u3000\"}",
+    ]
+
+    def assert_matches_python(self, method):
+        for sample in self.samples:
+            compiled = method(sample)
+            with mock.patch.object(parser_module, '_fastpath', None):
+                self.assertEqual(compiled, method(sample), sample)
+
+    def test_escape_illegal_characters(self):
+        self.assert_matches_python(Parser.escape_illegal_characters)
+
+    def test_ensure_ending_brackets(self):
+        self.assert_matches_python(Parser.ensure_ending_brackets)
+
+
+class TestDecoding(unittest.TestCase):
+    def assert_non_finite_numbers(self):
+        result = parser_schema_object_req.rescue('{"name": "Ann", "age": NaN}')
+        self.assertEqual(result['name'], 'Ann')
+        self.assertTrue(math.isnan(result['age']))
+        self.assertTrue(math.isnan(parser_no_schema.rescue('NaN')))
+        self.assertEqual(parser_no_schema.rescue('[1e400, -Infinity]'), [math.inf, -math.inf])
+
+    @unittest.skipIf(parser_module._orjson_loads is None, "orjson not installed")
+    def test_fast_decode_falls_back_to_json(self):
+        result = Parser(schema_with_requirements, fast_decode=True).rescue('{"name": "Ann", "age": NaN}')
+        self.assertTrue(math.isnan(result['age']))
+        self.assertEqual(Parser(fast_decode=True).rescue('[1e400, -Infinity]'), [math.inf, -math.inf])
+
+    def test_default_decoding_is_exact(self):
+        self.assert_non_finite_numbers()
+        self.assertEqual(parser_no_schema.rescue('{"id": 12345678901234567890123}'), {"id": 12345678901234567890123})
+        self.assertEqual(parser_no_schema.rescue('id: {"id": 12345678901234567890123}'),
+                         {"id": 12345678901234567890123})
+
+    def test_fast_decode_requires_orjson(self):
+        with mock.patch.object(parser_module, '_orjson_loads', None):
+            with self.assertRaises(ImportError):
+                Parser(fast_decode=True)
+
 if __name__ == '__main__':
     unittest.main()